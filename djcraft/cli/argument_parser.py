@@ -1,29 +1,67 @@
 import argparse
 import json
+from functools import lru_cache
+from typing import Optional
 
-from core.config import DefaultSettings
+# subcommand -> help shown in the command list
+COMMAND_HELP = {
+    'create': 'Create a new Django project',
+    'interactive': 'Create a project in interactive mode',
+    'generate': 'Generate project from config file',
+    'validate': 'Validate project configuration file without generating',
+}
 
 
-def create_argument_parser():
+def _create_root_parser():
+    """Build the top-level parser and its (still empty) subcommand group"""
     parser = argparse.ArgumentParser(
         description='Django Project Boilerplate Generator',
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
 
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+    return parser, subparsers
 
-    _add_create_command(subparsers)
-    _add_interactive_command(subparsers)
-    _add_generate_command(subparsers)
-    _add_validate_command(subparsers)
+
+def create_help_parser():
+    """
+    Build a parser that only lists the commands, for printing top-level help.
+    It skips every command's arguments, so nothing beyond argparse is needed.
+    """
+    parser, subparsers = _create_root_parser()
+    for command, help_text in COMMAND_HELP.items():
+        subparsers.add_parser(command, help=help_text)
+    return parser
+
+
+@lru_cache(maxsize=None)
+def create_argument_parser(command: Optional[str] = None):
+    """
+    Build the CLI parser (once per process and command; parsing doesn't modify it)
+
+    Args:
+        command: The subcommand about to be parsed (e.g. sys.argv[1]). When it names
+            a known command only that subparser is built; otherwise all of them are,
+            so help and "invalid choice" errors list every command.
+    """
+    parser, subparsers = _create_root_parser()
+
+    if command in COMMAND_PARSERS:
+        COMMAND_PARSERS[command](subparsers)
+    else:
+        for add_command in COMMAND_PARSERS.values():
+            add_command(subparsers)
 
     return parser
 
 
 def _add_create_command(subparsers):
     """Add 'create' command parser"""
+    # the settings are only needed for this command's defaults and choices, and the
+    # parser is cached, so they are imported (and the service names read) once
+    from core.config import DefaultSettings
 
-    create_parser = subparsers.add_parser('create', help='Create a new Django project')
+    create_parser = subparsers.add_parser('create', help=COMMAND_HELP['create'])
     create_parser.add_argument('project_name', help='Name of the Django project')
     create_parser.add_argument(
         '--apps',
@@ -58,7 +96,7 @@ def _add_create_command(subparsers):
     create_parser.add_argument(
         '--services',
         nargs='+',
-        choices=DefaultSettings.AVAILABLE_SERVICES.get_service_names(),
+        choices=tuple(DefaultSettings.AVAILABLE_SERVICES.get_service_names()),
         default=[],
         help='Services to include in the project'
     )
@@ -72,18 +110,12 @@ def _add_create_command(subparsers):
 
 def _add_interactive_command(subparsers):
     """Add 'interactive' command parser"""
-    subparsers.add_parser(
-        'interactive',
-        help='Create a project in interactive mode'
-    )
+    subparsers.add_parser('interactive', help=COMMAND_HELP['interactive'])
 
 
 def _add_generate_command(subparsers):
     """Add 'generate' command parser"""
-    generate_parser = subparsers.add_parser(
-        'generate',
-        help='Generate project from config file'
-    )
+    generate_parser = subparsers.add_parser('generate', help=COMMAND_HELP['generate'])
     generate_parser.add_argument(
         'config_file',
         help='Path to YAML or JSON configuration file'
@@ -92,11 +124,17 @@ def _add_generate_command(subparsers):
 
 def _add_validate_command(subparsers):
     """Add 'validate' command parser"""
-    validate_parser = subparsers.add_parser(
-        'validate',
-        help='Validate project configuration file without generating'
-    )
+    validate_parser = subparsers.add_parser('validate', help=COMMAND_HELP['validate'])
     validate_parser.add_argument(
         'config_file',
         help='Path to YAML or JSON configuration file to validate'
     )
+
+
+# subcommand -> function adding its parser, in the order they're listed in help
+COMMAND_PARSERS = {
+    'create': _add_create_command,
+    'interactive': _add_interactive_command,
+    'generate': _add_generate_command,
+    'validate': _add_validate_command,
+}
@@ -1,4 +1,4 @@
-import os
+import logging
 import sys
 
 from core.configuration_manager import ConfigurationManager
@@ -6,7 +6,8 @@ from core.project_structure_manager import ProjectStructureManager
 from generator.generator import DjangoProjectGenerator
 
 from .config_io import validate_config
-from .interactive.ui import preview_structure
+
+logger = logging.getLogger(__name__)
 
 
 def handle_create_command(args):
@@ -66,9 +67,7 @@ def handle_generate_from_config(config_path):
     Returns:
         ProjectStructureManager: Configured structure manager
     """
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-    
+    # a missing file surfaces as ConfigurationError when it is read
     config = ConfigurationManager(config_path)
     structure_manager = create_project_from_config(config)
     
@@ -84,9 +83,6 @@ def handle_validate_command(config_path, console=None, rich_available=False):
         console: Rich console if available
         rich_available: Whether Rich is available
     """
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-
     config = ConfigurationManager(config_path)
     errors = validate_config(config)
 
@@ -108,6 +104,8 @@ def handle_validate_command(config_path, console=None, rich_available=False):
 
         if rich_available:
             from rich.prompt import Confirm
+
+            from .interactive.ui import preview_structure
             if Confirm.ask("[bold blue]Show structure preview?[/bold blue]"):
                 structure_manager = create_project_structure_from_config(config, preview_only=True)
                 preview_structure(structure_manager, console)
@@ -145,8 +143,8 @@ def create_project_structure_from_config(config_manager, preview_only=False):
     Returns:
         ProjectStructureManager: Configured structure manager
     """
-    # Get all configuration as a single dictionary
-    config = config_manager.get_all_config()
+    # Get all configuration as a single read-only mapping
+    config = config_manager.get_all_config_view()
     
     project_name = config['cli']['project_name']
     structure_manager = ProjectStructureManager(project_name)
@@ -164,7 +162,7 @@ def create_project_structure_from_config(config_manager, preview_only=False):
         try:
             structure_manager.add_directory(name, parent)
         except Exception as e:
-            print(f"Warning: Could not add directory '{name}': {e}")
+            logger.warning("Could not add directory '%s': %s", name, e)
 
     # Create apps
     apps = config['apps'] or []
@@ -174,7 +172,7 @@ def create_project_structure_from_config(config_manager, preview_only=False):
         try:
             structure_manager.add_app(name, directory)
         except Exception as e:
-            print(f"Warning: Could not add app '{name}': {e}")
+            logger.warning("Could not add app '%s': %s", name, e)
 
     # Add services if not preview mode
     if not preview_only:
@@ -189,6 +187,6 @@ def create_project_structure_from_config(config_manager, preview_only=False):
             try:
                 structure_manager.add_service(name, options)
             except Exception as e:
-                print(f"Warning: Could not add service '{name}': {e}")
+                logger.warning("Could not add service '%s': %s", name, e)
 
     return structure_manager
@@ -1,13 +1,42 @@
+import io
 import json
+import logging
 import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List, Mapping
 
-import yaml
 from core.configuration_manager import ConfigurationManager
+from core.exceptions import FileGenerationError
 from core.project_structure_manager import ProjectStructureManager
 from core.rules import StructureRules
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _load_yaml(f) -> Dict:
+    # yaml is imported on first use so JSON-only runs never load it
+    import yaml
+    return yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+def _load_json(f) -> Dict:
+    if orjson is not None:
+        return orjson.loads(f.read())
+    return json.load(f)
+
+
+# config file suffix -> loader taking the open file
+_LOADERS = {
+    '.yaml': _load_yaml,
+    '.yml': _load_yaml,
+    '.json': _load_json,
+}
+
 
 def load_config_file(config_path: str) -> Dict:
     """
@@ -19,52 +48,54 @@ def load_config_file(config_path: str) -> Dict:
     Returns:
         Dictionary containing the configuration
     """
-    with open(config_path, 'r') as f:
-        if config_path.endswith('.yaml') or config_path.endswith('.yml'):
-            config = yaml.safe_load(f)
-        elif config_path.endswith('.json'):
-            config = json.load(f)
-        else:
-            raise ValueError("Config file must be YAML or JSON")
+    loader = _LOADERS.get(Path(config_path).suffix.lower())
+    if loader is None:
+        raise ValueError("Config file must be YAML or JSON")
 
-    return config
+    # both parsers take bytes and detect the encoding themselves
+    with open(config_path, 'rb') as f:
+        return loader(f)
 
 
-def validate_config(config) -> List[str]:
+def validate_config(config: ConfigurationManager) -> List[str]:
     """
     Validate configuration without creating project
     
     Args:
-        config: Configuration file dictionary
+        config: Configuration manager loaded from the config file
         
     Returns:
         List of validation errors (empty if valid)
     """
     errors = []
 
-    if 'project_name' not in config:
+    if not config.has_project_name():
         errors.append("Missing required field: project_name")
         return errors
 
-    project_name = config['project_name']
+    # resolved once and shared by every validator below
+    full_config = config.get_all_config_view()
+
+    project_name = full_config['cli']['project_name']
     if not project_name:
         errors.append("Project name cannot be empty")
+        return errors
 
     # Create temporary structure manager for validation
     try:
         structure_manager = ProjectStructureManager(project_name)
 
         # Validate core configuration
-        errors.extend(_validate_core_config(config, structure_manager))
+        errors.extend(_validate_core_config(full_config, structure_manager))
         
         # Validate directories
-        errors.extend(_validate_directories_config(config))
+        errors.extend(_validate_directories_config(full_config))
         
         # Validate apps
-        errors.extend(_validate_apps_config(config))
+        errors.extend(_validate_apps_config(full_config))
         
         # Validate services
-        errors.extend(_validate_services_config(config))
+        errors.extend(_validate_services_config(full_config, config.get_available_services()))
 
     except Exception as e:
         errors.append(f"Configuration error: {e}")
@@ -72,13 +103,12 @@ def validate_config(config) -> List[str]:
     return errors
 
 
-def _validate_core_config(config, structure_manager: ProjectStructureManager) -> List[str]:
+def _validate_core_config(config: Mapping, structure_manager: ProjectStructureManager) -> List[str]:
     """Validate core configuration"""
     errors = []
-    config = config.get_all_config()
-    core_config = config['core'] or {}
-    core_location = core_config['location'] or config['project_structure']['core_location']
-    core_path = core_config['path'] or config['project_structure']['core_path']
+    # the config file's 'core' section is merged into project_structure on load
+    core_location = config['project_structure']['core_location']
+    core_path = config['project_structure']['core_path']
 
     try:
         structure_manager.set_core_location(core_location, core_path)
@@ -88,14 +118,12 @@ def _validate_core_config(config, structure_manager: ProjectStructureManager) ->
     return errors
 
 
-def _validate_directories_config(config) -> List[str]:
+def _validate_directories_config(config: Mapping) -> List[str]:
     """Validate directories configuration"""
     errors = []
-    config = config.get_all_config()
-    directories = config['directories'] or []
+    directories = config.get('directories') or []
     for directory in directories:
         name = directory['name']
-        _ = directory['parent'] or ""
 
         if not name:
             errors.append("Directory missing name")
@@ -110,14 +138,12 @@ def _validate_directories_config(config) -> List[str]:
     return errors
 
 
-def _validate_apps_config(config: Dict) -> List[str]:
+def _validate_apps_config(config: Mapping) -> List[str]:
     """Validate apps configuration"""
     errors = []
-    config = config.get_all_config()
-    apps = config['apps'] or []
+    apps = config.get('apps') or []
     for app in apps:
         name = app['name']
-        _ = app['directory'] or ""
 
         if not name:
             errors.append("App missing name")
@@ -132,22 +158,21 @@ def _validate_apps_config(config: Dict) -> List[str]:
     return errors
 
 
-def _validate_services_config(config: Dict) -> List[str]:
+def _validate_services_config(config: Mapping, available_services: Iterable[str]) -> List[str]:
     """Validate services configuration"""
     errors = []
-    config = config.get_all_config()
-    services = config['services'] or []
-    existing_service_names = []
+    services = config.get('services') or []
+    available = frozenset(available_services)
+    existing_service_names = set()
     
     for service in services:
         name = service['name']
-        _ = service['options'] or {}
 
         if not name:
             errors.append("Service missing name")
             continue
 
-        if name not in ConfigurationManager().get_available_services():
+        if name not in available:
             errors.append(f"Unknown service: {name}")
             continue
 
@@ -155,7 +180,7 @@ def _validate_services_config(config: Dict) -> List[str]:
             if not StructureRules.validate_service_compatibility(name, existing_service_names):
                 errors.append(f"Service '{name}' has compatibility issues with existing services.")
 
-            existing_service_names.append(name)
+            existing_service_names.add(name)
         except Exception as e:
             errors.append(f"Invalid service '{name}': {e}")
             
@@ -174,70 +199,85 @@ def save_configuration(structure_manager: ProjectStructureManager, config_path:
     external_config_data = {
         'project_name': structure_manager.project_name,
         'core': internal_structure['core'],
-        'directories': [],
-        'apps': [],
+        'directories': [
+            {'name': dir_info['name'], 'parent': dir_info.get('parent', '')}
+            for _, dir_info in structure_manager.directories_sorted()
+        ],
+        # app paths are '/'-joined, so the directory is everything before the last '/'
+        'apps': [
+            {'name': app_name, 'directory': app_path.rpartition('/')[0]}
+            for app_name, app_path in structure_manager.apps_sorted()
+        ],
         'services': internal_structure['services'],
         'env': internal_structure.get('env', 'dev')
     }
 
-    for dir_path in sorted(internal_structure['directories'].keys()):
-        dir_info = internal_structure['directories'][dir_path]
-        external_config_data['directories'].append({
-            'name': dir_info['name'],
-            'parent': dir_info.get('parent', '')
-        })
-
-    for app_name in sorted(internal_structure['apps'].keys()):
-        app_path = internal_structure['apps'][app_name]
-        external_config_data['apps'].append({
-            'name': app_name,
-            'directory': str(Path(app_path).parent) if Path(app_path).parent != Path('.') else ''
-        })
-
     output_dir = Path(config_path).parent
     output_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        if config_path.endswith('.yaml') or config_path.endswith('.yml'):
-            _save_yaml_config(config_path, external_config_data)
-        elif config_path.endswith('.json'):
-            _save_json_config(config_path, external_config_data)
-        else:
+        saver = _SAVERS.get(Path(config_path).suffix.lower())
+        if saver is None:
             raise ValueError("Config file must have a .yaml, .yml, or .json extension")
+        saver(config_path, external_config_data)
     except Exception as e:
-        raise DjangoBoilerplateError(f"Failed to save configuration: {e}")
+        raise FileGenerationError(config_path, f"Failed to save configuration: {e}") from e
 
 
 def _save_yaml_config(config_path: str, data: Dict) -> None:
     """Save configuration as YAML with comments"""
+    import yaml
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+    # build the whole document in memory, then hand it to the file in one write
+    buf = io.StringIO()
+    buf.write("# Required: The name of your Django project\n")
+    yaml.dump({'project_name': data['project_name']}, buf, Dumper=dumper, indent=2, default_flow_style=False)
+    buf.write("\n# Optional: Configure the core Django files location\n")
+    yaml.dump({'core': data['core']}, buf, Dumper=dumper, indent=2, default_flow_style=False)
+    buf.write("\n# Optional: Define directories\n")
+    yaml.dump({'directories': data['directories']}, buf, Dumper=dumper, indent=2, default_flow_style=False)
+    buf.write("\n# Optional: Define apps and their directories\n")
+    yaml.dump({'apps': data['apps']}, buf, Dumper=dumper, indent=2, default_flow_style=False)
+    buf.write("\n# Optional: Define services and their options\n")
+    yaml.dump({'services': data['services']}, buf, Dumper=dumper, indent=2, default_flow_style=False)
+    buf.write("\n# Optional: Environment setting (used in settings/__init__.py)\n")
+    yaml.dump({'env': data['env']}, buf, Dumper=dumper, indent=2, default_flow_style=False)
+
     with open(config_path, 'w') as f:
-        f.write("# Required: The name of your Django project\n")
-        yaml.dump({'project_name': data['project_name']}, f, indent=2, default_flow_style=False)
-        f.write("\n# Optional: Configure the core Django files location\n")
-        yaml.dump({'core': data['core']}, f, indent=2, default_flow_style=False)
-        f.write("\n# Optional: Define directories\n")
-        yaml.dump({'directories': data['directories']}, f, indent=2, default_flow_style=False)
-        f.write("\n# Optional: Define apps and their directories\n")
-        yaml.dump({'apps': data['apps']}, f, indent=2, default_flow_style=False)
-        f.write("\n# Optional: Define services and their options\n")
-        yaml.dump({'services': data['services']}, f, indent=2, default_flow_style=False)
-        f.write("\n# Optional: Environment setting (used in settings/__init__.py)\n")
-        yaml.dump({'env': data['env']}, f, indent=2, default_flow_style=False)
-        
-        _flush_buffer(f)
+        f.write(buf.getvalue())
+        _sync_if_durable(f)
 
 
 def _save_json_config(config_path: str, data: Dict) -> None:
     """Save configuration as JSON"""
-    with open(config_path, 'w') as f:
-        json.dump(data, f, indent=2)
-        _flush_buffer(f)
+    if orjson is not None:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        content = json.dumps(data, indent=2).encode('utf-8')
 
+    with open(config_path, 'wb') as f:
+        f.write(content)
+        _sync_if_durable(f)
 
-def _flush_buffer(file) -> None:
-    """Attempt to flush file buffer and sync to disk"""
+
+# config file suffix -> saver taking the path and the data
+_SAVERS = {
+    '.yaml': _save_yaml_config,
+    '.yml': _save_yaml_config,
+    '.json': _save_json_config,
+}
+
+
+def _sync_if_durable(file) -> None:
+    """
+    Flush and fsync the file when DJCRAFT_DURABLE_WRITE=1 is set.
+    Otherwise the file is left to the normal close, avoiding a synchronous disk barrier per save.
+    """
+    if os.environ.get('DJCRAFT_DURABLE_WRITE') != '1':
+        return
     try:
         file.flush()
         os.fsync(file.fileno())
     except Exception as e:
-        print(f"Warning: Could not fully flush buffer for file {file.name}: {e}")
+        logger.warning("Could not fully flush buffer for file %s: %s", file.name, e)
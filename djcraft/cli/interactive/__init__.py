@@ -1,4 +1,5 @@
 import sys
+import traceback
 
 from core.config import DefaultSettings
 from core.exceptions import DjCraftError 
@@ -65,6 +66,5 @@ def run_interactive_mode(console: Console) -> ProjectStructureManager:
         sys.exit(1)
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred during interactive mode: {e}[/bold red]")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
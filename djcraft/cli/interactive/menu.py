@@ -1,4 +1,4 @@
-from core.configuration_manager import ConfigurationManager
+from core.configuration_manager import get_default_config_manager
 from core.exceptions import DjCraftError
 from core.project_structure_manager import ProjectStructureManager
 from rich.console import Console
@@ -153,7 +153,7 @@ def _add_service_interactive(structure_manager: ProjectStructureManager, console
     if not service_name:
         return
 
-    service_info = ConfigurationManager().get_service_info(service_name)
+    service_info = get_default_config_manager().get_service_info(service_name)
     options = {}
     if service_info.get('options'):
          options = ask_service_options(service_name, service_info, console)
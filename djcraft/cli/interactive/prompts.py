@@ -1,6 +1,6 @@
 from typing import Any, Dict, Tuple
 
-from core.configuration_manager import ConfigurationManager
+from core.configuration_manager import get_default_config_manager
 from core.project_structure_manager import ProjectStructureManager
 from rich.console import Console
 from rich.prompt import IntPrompt, Prompt
@@ -74,7 +74,8 @@ def ask_app_details(structure_manager: ProjectStructureManager, console: Console
 
 def ask_service_to_add(console: Console) -> str | None:
     """Prompts the user to select a service to add."""
-    available_services = list(ConfigurationManager().get_available_services())
+    config = get_default_config_manager()
+    available_services = list(config.get_available_services())
     if not available_services:
         console.print("[italic]No services available to add.[/italic]")
         return None
@@ -87,7 +88,7 @@ def ask_service_to_add(console: Console) -> str | None:
     table.add_column("Description")
 
     for i, service_name in enumerate(available_services):
-        info = ConfigurationManager().get_service_info(service_name)
+        info = config.get_service_info(service_name)
         table.add_row(str(i + 1), service_name, info['description'])
 
     console.print(table)
@@ -121,17 +122,21 @@ def ask_service_options(service_name: str, service_info: Dict[str, Any], console
 
                 console.print(options_table)
 
+                # the prompt's choices and default don't change between retries, so build them once;
+                # the default is the 1-based position of the service's default value (else the first)
+                choices = [str(i + 1) for i in range(len(allowed_values))]
+                default_value = service_info['default_options'].get(option_name)
+                default_choice = next(
+                    (choice for choice, value in zip(choices, allowed_values) if value == default_value),
+                    "1"
+                )
+
                 while True:
                     try:
-                        default_value = service_info['default_options'].get(option_name)
-                        default_idx = -1
-                        if default_value in allowed_values:
-                             default_idx = allowed_values.index(default_value)
-
                         option_choice_str = Prompt.ask(
                             f"[bold cyan]Select value for '{option_name}'[/bold cyan]",
-                            choices=[str(i + 1) for i in range(len(allowed_values))],
-                            default=str(default_idx + 1) if default_idx != -1 else "1",
+                            choices=choices,
+                            default=default_choice,
                             console=console
                         )
                         option_choice = int(option_choice_str)
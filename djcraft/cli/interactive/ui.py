@@ -1,3 +1,4 @@
+import heapq
 from pathlib import Path
 
 from core.project_structure_manager import ProjectStructureManager
@@ -34,9 +35,8 @@ def print_welcome(console: Console):
     ))
 
 
-def print_menu(console: Console):
-    """Prints the main interactive menu."""
-    console.print("\n[bold blue]Main Menu[/bold blue]")
+def _build_main_menu_table() -> Table:
+    """Builds the static main menu table."""
     table = Table(show_header=False, expand=False, show_lines=False)
     table.add_column("Option", style="cyan")
     table.add_column("Description")
@@ -48,7 +48,17 @@ def print_menu(console: Console):
     table.add_row("5", "Preview Project Structure")
     table.add_row("6", "Done")
 
-    console.print(table)
+    return table
+
+
+# the menu never changes, so it is built once and reprinted on every loop
+_MAIN_MENU_TABLE = _build_main_menu_table()
+
+
+def print_menu(console: Console):
+    """Prints the main interactive menu."""
+    console.print("\n[bold blue]Main Menu[/bold blue]")
+    console.print(_MAIN_MENU_TABLE)
 
 
 def show_directories(structure_manager: ProjectStructureManager, console: Console):
@@ -75,7 +85,7 @@ def show_apps(structure_manager: ProjectStructureManager, console: Console):
     table.add_column("App Name", style="bold green")
     table.add_column("Path")
 
-    for name, path in sorted(apps.items()):
+    for name, path in structure_manager.apps_sorted():
         table.add_row(name, path)
 
     console.print("[bold]Existing Apps:[/bold]")
@@ -122,19 +132,26 @@ def _show_directory_tree(structure_manager: ProjectStructureManager, console: Co
     # Dictionary to hold tree nodes for easier adding of children
     directory_nodes = {"": tree}  # Root directory maps to the main tree
 
+    # Group apps by their parent directory once, instead of per tree level
+    apps_by_parent = {}
+    for name, path in structure_manager.apps_sorted():
+        if path != core_path_str:  # Exclude apps at core path
+            apps_by_parent.setdefault(_parent(path), []).append((name, path))
+
     # Add top-level directories and their contents
-    top_level_items = sorted([
-        (path, info) for path, info in structure['directories'].items() if not info['parent']
-    ])
+    top_level_items = [
+        (path, info) for path, info in structure_manager.directories_sorted() if not info['parent']
+    ]
 
     # Include root-level apps and core if they are at the root
-    root_level_apps = sorted([
-        (name, path) for name, path in structure['apps'].items() if '/' not in path and path != core_path_str
-    ])
+    root_level_apps = [
+        (name, path) for name, path in structure_manager.apps_sorted() if '/' not in path and path != core_path_str
+    ]
 
 
     # Combine top-level directories and root-level apps/core for iteration
-    all_root_items = sorted(list(top_level_items) + list(root_level_apps))
+    # (both lists are already sorted, so a linear merge is enough)
+    all_root_items = list(heapq.merge(top_level_items, root_level_apps))
 
     if structure['core']['location'] == 'root':
          all_root_items.append((core_path_str, {'type': 'core'})) # Add core as a special item
@@ -147,7 +164,7 @@ def _show_directory_tree(structure_manager: ProjectStructureManager, console: Co
         elif isinstance(item_info, dict) and 'name' in item_info: # It's a directory
             dir_node = tree.add(f"📁 [bold blue]{item_info['name']}[/bold blue]")
             directory_nodes[item_path] = dir_node
-            _add_sub_items_to_tree(structure_manager, dir_node, item_path, directory_nodes)
+            _add_sub_items_to_tree(structure_manager, dir_node, item_path, directory_nodes, apps_by_parent)
         else: # It's a root-level app not at the core path
              app_name = item_path # In root_level_apps, item_path is the app name
              tree.add(f"📦 [bold green]{app_name}[/bold green] (App)")
@@ -156,35 +173,38 @@ def _show_directory_tree(structure_manager: ProjectStructureManager, console: Co
     console.print(tree)
 
 
-def _add_sub_items_to_tree(structure_manager: ProjectStructureManager, parent_node: Tree, parent_path: str, directory_nodes):
+def _parent(path: str) -> str:
+    """Return the parent of a '/'-joined structure path ('' for root level)."""
+    i = path.rfind('/')
+    return path[:i] if i >= 0 else ''
+
+
+def _add_sub_items_to_tree(structure_manager: ProjectStructureManager, parent_node: Tree, parent_path: str, directory_nodes, apps_by_parent):
     """Recursively adds subdirectories, apps, and core (if applicable) to a Rich tree node."""
     structure = structure_manager.structure
     core_path_str = structure['core']['path']
 
     # Add subdirectories within this parent directory
-    subdirs = sorted([
-        (path, info) for path, info in structure['directories'].items() if info.get('parent') == parent_path
-    ])
+    subdirs = [
+        (path, info) for path, info in structure_manager.directories_sorted() if info.get('parent') == parent_path
+    ]
 
     for subdir_path, subdir_info in subdirs:
         # Don't add the core path again if it's a subdirectory already handled
         if subdir_path != core_path_str:
             dir_node = parent_node.add(f"📁 [bold blue]{subdir_info['name']}[/bold blue]")
             directory_nodes[subdir_path] = dir_node  # Store the node
-            _add_sub_items_to_tree(structure_manager, dir_node, subdir_path, directory_nodes)
+            _add_sub_items_to_tree(structure_manager, dir_node, subdir_path, directory_nodes, apps_by_parent)
 
 
     # Add apps directly within this parent directory
-    dir_apps = sorted([
-        (name, path) for name, path in structure['apps'].items()
-        if str(Path(path).parent) == parent_path and path != core_path_str # Exclude apps at core path
-    ])
+    dir_apps = apps_by_parent.get(parent_path, [])
 
     for app_name, app_path in dir_apps:
         parent_node.add(f"📦 [bold green]{app_name}[/bold green] (App)")
 
     # Check if the core path is directly within this parent directory and add it
-    if core_path_str != "" and str(Path(core_path_str).parent) == parent_path:
-        core_name = Path(core_path_str).name
+    if core_path_str != "" and _parent(core_path_str) == parent_path:
+        core_name = core_path_str[len(parent_path) + 1:]
         core_label = f"⚙️ [bold yellow] {core_name}[/bold yellow] ([italic]Core[/italic])"
         parent_node.add(core_label)
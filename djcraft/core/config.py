@@ -1,47 +1,49 @@
 # config.py
-import os
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+# the bundled templates live next to the packages; resolved once, at import
+TEMPLATE_DIR = str(Path(__file__).resolve().parent.parent / 'templates')
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ProjectStructureDefaultSettings:
     core_location: str = 'root'
     core_path: str = 'core'
     settings_structure: str = 'folder'
-    required_folders: List[str] = field(default_factory=lambda: ['static', 'media', 'templates'])
+    required_folders: Tuple[str, ...] = ('static', 'media', 'templates')
     docs_dir: str = 'docs'
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FilesDefaultSettings:
-    project: List[str] = field(default_factory=lambda: ['manage.py', '.gitignore', 'README.md', 'requirements.txt'])
-    core: List[str] = field(default_factory=lambda: ['__init__.py', 'urls.py', 'wsgi.py', 'asgi.py'])
-    core_settings: List[str] = field(default_factory=lambda: ['base.py', 'dev.py', 'prod.py', '__init__.py'])
-    app: List[str] = field(default_factory=lambda: ['__init__.py', 'admin.py', 'apps.py', 'models.py', 'views.py', 'urls.py'])
-    app_subdirectories: List[str] = field(default_factory=lambda: ['migrations', 'tests'])
-    docker: List[str] = field(default_factory=lambda: ['Dockerfile', 'docker-compose.yml', '.dockerignore'])
-    celery: List[str] = field(default_factory=lambda: ['celery.py'])
-    auth: List[str] = field(default_factory=lambda: [
+    project: Tuple[str, ...] = ('manage.py', '.gitignore', 'README.md', 'requirements.txt')
+    core: Tuple[str, ...] = ('__init__.py', 'urls.py', 'wsgi.py', 'asgi.py')
+    core_settings: Tuple[str, ...] = ('base.py', 'dev.py', 'prod.py', '__init__.py')
+    app: Tuple[str, ...] = ('__init__.py', 'admin.py', 'apps.py', 'models.py', 'views.py', 'urls.py')
+    app_subdirectories: Tuple[str, ...] = ('migrations', 'tests')
+    docker: Tuple[str, ...] = ('Dockerfile', 'docker-compose.yml', '.dockerignore')
+    celery: Tuple[str, ...] = ('celery.py',)
+    auth: Tuple[str, ...] = (
         'models.py', 'admin.py', 'apps.py', '__init__.py',
         'migrations/__init__.py', 'tests/__init__.py', 'tests/test_models.py'
-    ])
-    rest_api: List[str] = field(default_factory=lambda: ['api_urls.py'])
-    db_router: List[str] = field(default_factory=lambda: ['router.py'])
+    )
+    rest_api: Tuple[str, ...] = ('api_urls.py',)
+    db_router: Tuple[str, ...] = ('router.py',)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TemplateDefaultSettings:
     template_engine: str = 'jinja2'
     template_ext: str = '.template'
-    template_dir: str = os.path.join(Path(__file__).parent.parent, 'templates')
+    template_dir: str = TEMPLATE_DIR
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DjangoDefaultsSettings:
-    default_apps: List[str] = field(default_factory=lambda: [
+    default_apps: Tuple[str, ...] = (
         'django.contrib.admin', 'django.contrib.auth', 'django.contrib.contenttypes',
         'django.contrib.sessions', 'django.contrib.messages', 'django.contrib.staticfiles'
-    ])
-    default_middleware: List[str] = field(default_factory=lambda: [
+    )
+    default_middleware: Tuple[str, ...] = (
         'django.middleware.security.SecurityMiddleware',
         'django.contrib.sessions.middleware.SessionMiddleware',
         'django.middleware.common.CommonMiddleware',
@@ -49,16 +51,16 @@ class DjangoDefaultsSettings:
         'django.contrib.auth.middleware.AuthenticationMiddleware',
         'django.contrib.messages.middleware.MessageMiddleware',
         'django.middleware.clickjacking.XFrameOptionsMiddleware'
-    ])
+    )
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServiceOption:
     description: str
     dependencies: List[str] = field(default_factory=list)
     options: Dict[str, Any] = field(default_factory=dict)
     default_options: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AvailableServices:
     docker: ServiceOption = field(default_factory=lambda: ServiceOption(
         description='Docker configuration for containerization',
@@ -95,7 +97,10 @@ class AvailableServices:
     def get_service_names(self) -> List[str]:
         return list(self.__dataclass_fields__.keys())
 
-@dataclass
+    def get_services_by_name(self) -> Dict[str, ServiceOption]:
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+@dataclass(frozen=True, slots=True)
 class CliDefaultSettings:
     project_name: str = 'myproject'
     apps: List[str] = field(default_factory=list)
@@ -115,13 +120,13 @@ class DefaultSettings:
     DJANGO_DEFAULTS = DjangoDefaultsSettings()
     AVAILABLE_SERVICES = AvailableServices()
     CLI_DEFAULTS = CliDefaultSettings()
+    # plain dict lookup, and names that aren't services (e.g. methods) never match
+    SERVICES_BY_NAME = AVAILABLE_SERVICES.get_services_by_name()
     
     @classmethod
     def get_service_info(cls, service_name: str) -> Optional[ServiceOption]:
         """Get service info by name."""
-        if hasattr(cls.AVAILABLE_SERVICES, service_name):
-            return getattr(cls.AVAILABLE_SERVICES, service_name)
-        return None
+        return cls.SERVICES_BY_NAME.get(service_name)
     
     @classmethod
     def get_service_dependencies(cls, service_name: str) -> List[str]:
@@ -134,3 +139,12 @@ class DefaultSettings:
         """Get default options for a service."""
         service = cls.get_service_info(service_name)
         return service.default_options if service else {}
+
+
+# dict forms of the defaults; the dataclasses above are never mutated, so
+# these are built once instead of running asdict on every config read
+DEFAULT_PROJECT_STRUCTURE_DICT = asdict(DefaultSettings.PROJECT_STRUCTURE)
+DEFAULT_FILES_DICT = asdict(DefaultSettings.DEFAULT_FILES)
+DEFAULT_TEMPLATE_DICT = asdict(DefaultSettings.TEMPLATE_CONFIG)
+DEFAULT_DJANGO_DICT = asdict(DefaultSettings.DJANGO_DEFAULTS)
+DEFAULT_CLI_DICT = asdict(DefaultSettings.CLI_DEFAULTS)
@@ -1,13 +1,35 @@
+import copy
 import os
 from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from .config import DefaultSettings
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .config import (
+    DEFAULT_CLI_DICT,
+    DEFAULT_DJANGO_DICT,
+    DEFAULT_FILES_DICT,
+    DEFAULT_PROJECT_STRUCTURE_DICT,
+    DEFAULT_TEMPLATE_DICT,
+    DefaultSettings,
+)
 from .exceptions import ConfigurationError
 from .runtime_config import RuntimeConfig
 
 
+@lru_cache(maxsize=None)
+def _service_dependencies(service_name: str) -> Tuple[str, ...]:
+    """Dependencies of a service; they are static defaults, so each lookup happens once"""
+    return tuple(DefaultSettings.get_service_dependencies(service_name))
+
+
+@lru_cache(maxsize=None)
+def _service_default_options_view(service_name: str) -> Mapping[str, Any]:
+    """Read-only default options of a service, built once per service name"""
+    return MappingProxyType(DefaultSettings.get_service_default_options(service_name))
+
+
 class ConfigurationManager:
     """Manages the configuration system by merging default settings with runtime configurations."""
 
@@ -19,6 +41,7 @@ class ConfigurationManager:
         """
         self._default_settings = DefaultSettings()
         self._runtime_config = None
+        self._all_config_cache: Optional[Dict[str, Any]] = None
         if yaml_config_path:
             self.load_runtime_config(yaml_config_path)
 
@@ -31,10 +54,11 @@ class ConfigurationManager:
         Raises:
             ConfigurationError: If the YAML file is invalid or cannot be loaded.
         """
+        self._all_config_cache = None
         try:
             self._runtime_config = RuntimeConfig.from_yaml(yaml_path)
         except ConfigurationError as e:
-            raise ConfigurationError(f"Failed to load runtime configuration: {e}")
+            raise ConfigurationError(str(yaml_path), f"Failed to load runtime configuration: {e.error}")
 
     @property
     def project_structure(self) -> Dict[str, Any]:
@@ -45,7 +69,7 @@ class ConfigurationManager:
         """
         if self._runtime_config:
             return asdict(self._runtime_config.project_structure)
-        return asdict(self._default_settings.PROJECT_STRUCTURE)
+        return copy.deepcopy(DEFAULT_PROJECT_STRUCTURE_DICT)
 
     @property
     def files(self) -> Dict[str, Any]:
@@ -56,7 +80,7 @@ class ConfigurationManager:
         """
         if self._runtime_config:
             return asdict(self._runtime_config.files)
-        return asdict(self._default_settings.DEFAULT_FILES)
+        return copy.deepcopy(DEFAULT_FILES_DICT)
 
     @property
     def template(self) -> Dict[str, Any]:
@@ -67,7 +91,7 @@ class ConfigurationManager:
         """
         if self._runtime_config:
             return asdict(self._runtime_config.template)
-        return asdict(self._default_settings.TEMPLATE_CONFIG)
+        return copy.deepcopy(DEFAULT_TEMPLATE_DICT)
 
     @property
     def django(self) -> Dict[str, Any]:
@@ -78,7 +102,7 @@ class ConfigurationManager:
         """
         if self._runtime_config:
             return asdict(self._runtime_config.django)
-        return asdict(self._default_settings.DJANGO_DEFAULTS)
+        return copy.deepcopy(DEFAULT_DJANGO_DICT)
 
     @property
     def cli(self) -> Dict[str, Any]:
@@ -89,7 +113,7 @@ class ConfigurationManager:
         """
         if self._runtime_config:
             return asdict(self._runtime_config.cli)
-        return asdict(self._default_settings.CLI_DEFAULTS)
+        return copy.deepcopy(DEFAULT_CLI_DICT)
 
     def get_service_info(self, service_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific service.
@@ -100,13 +124,11 @@ class ConfigurationManager:
         Returns:
             Service information dictionary or None if not found.
         """
-        available_services = self._default_settings.AVAILABLE_SERVICES
-        if hasattr(available_services, service_name):
-            service_info = getattr(available_services, service_name)
-            return asdict(service_info) if service_info else None
-        return None
+        service_info = self._default_settings.get_service_info(service_name)
+        return asdict(service_info) if service_info else None
 
-    def get_service_dependencies(self, service_name: str) -> List[str]:
+    @staticmethod
+    def get_service_dependencies(service_name: str) -> List[str]:
         """Get dependencies for a specific service.
 
         Args:
@@ -115,20 +137,38 @@ class ConfigurationManager:
         Returns:
             List of service dependencies.
         """
-        service_info = self.get_service_info(service_name)
-        return service_info.get('dependencies', []) if service_info else []
+        return list(_service_dependencies(service_name))
 
-    def get_service_default_options(self, service_name: str) -> Dict[str, Any]:
+    @staticmethod
+    def get_service_default_options(service_name: str) -> Dict[str, Any]:
         """Get default options for a specific service.
 
+        Service defaults don't depend on the runtime config, so this can be
+        called on the class as well as on an instance.
+
+        Args:
+            service_name: The name of the service.
+
+        Returns:
+            Dictionary of default service options (a copy, safe to modify).
+        """
+        # only the options are copied, not the whole service info via asdict
+        return copy.deepcopy(DefaultSettings.get_service_default_options(service_name))
+
+    @staticmethod
+    def get_service_default_options_view(service_name: str) -> Mapping[str, Any]:
+        """Get a read-only view of a service's default options.
+
+        The view is built once per service and shared, so use it for lookups
+        and merges; call get_service_default_options for a copy to modify.
+
         Args:
             service_name: The name of the service.
 
         Returns:
-            Dictionary of default service options.
+            Read-only mapping of default service options.
         """
-        service_info = self.get_service_info(service_name)
-        return service_info.get('default_options', {}) if service_info else {}
+        return _service_default_options_view(service_name)
     
     def get_template_path(self, template_name: str) -> str:
         """
@@ -163,6 +203,26 @@ class ConfigurationManager:
         Returns:
             Dictionary containing all configuration settings.
         """
+        return copy.deepcopy(self._get_all_config_cached())
+
+    def get_all_config_view(self) -> Mapping[str, Any]:
+        """
+        Get a read-only view of the complete configuration.
+
+        The view is shallow: the nested sections (cli, apps, services, ...) are the
+        cached objects themselves, so callers must not mutate them. Use
+        get_all_config for a copy that is safe to edit.
+
+        Returns:
+            Read-only mapping containing all configuration settings.
+        """
+        return MappingProxyType(self._get_all_config_cached())
+
+    def _get_all_config_cached(self) -> Dict[str, Any]:
+        """Build the unified configuration once and reuse it until the runtime config changes."""
+        if self._all_config_cache is not None:
+            return self._all_config_cache
+
         config = {
             'project_structure': self.project_structure,
             'files': self.files,
@@ -176,9 +236,19 @@ class ConfigurationManager:
             for key, value in self._runtime_config.to_dict().items():
                 if key not in config:
                     config[key] = value
-                    
+
+        self._all_config_cache = config
         return config
     
+    def has_project_name(self) -> bool:
+        """
+        Check whether the loaded configuration file sets project_name.
+
+        Returns:
+            True if a runtime config is loaded and it provides project_name.
+        """
+        return bool(self._runtime_config and self._runtime_config.project_name_provided)
+
     def get_available_services(self) -> List[str]:
         """
         Get list of all available service names.
@@ -187,3 +257,14 @@ class ConfigurationManager:
             List of service names.
         """
         return self._default_settings.AVAILABLE_SERVICES.get_service_names()
+
+
+@lru_cache(maxsize=1)
+def get_default_config_manager() -> ConfigurationManager:
+    """Get the shared ConfigurationManager with no runtime config loaded.
+
+    Use it for default-only lookups (available services, service info)
+    instead of constructing a new manager each time. Don't load a runtime
+    config into it; create a ConfigurationManager for that.
+    """
+    return ConfigurationManager()
@@ -1,3 +1,20 @@
+_PROJECT_NAME_MSG = (
+    "'{name}' is not a valid project name. "
+    "Project names must:\n"
+    "- Start with a letter\n"
+    "- Contain only letters, numbers, and underscores\n"
+    "- Be a valid Python identifier"
+)
+
+_APP_NAME_MSG = (
+    "'{name}' is not a valid app name. "
+    "App names must:\n"
+    "- Start with a lowercase letter\n"
+    "- Contain only lowercase letters, numbers, and underscores\n"
+    "- Be a valid Python identifier"
+)
+
+
 class DjCraftError(Exception):
     """Base exception class for all boilerplate generator exceptions"""
     pass
@@ -8,13 +25,7 @@ class InvalidProjectNameError(DjCraftError):
     
     def __init__(self, name: str):
         self.name = name
-        super().__init__(
-            f"'{name}' is not a valid project name. "
-            "Project names must:\n"
-            "- Start with a letter\n"
-            "- Contain only letters, numbers, and underscores\n"
-            "- Be a valid Python identifier"
-        )
+        super().__init__(_PROJECT_NAME_MSG.format(name=name))
 
 
 class InvalidAppNameError(DjCraftError):
@@ -22,13 +33,7 @@ class InvalidAppNameError(DjCraftError):
     
     def __init__(self, name: str):
         self.name = name
-        super().__init__(
-            f"'{name}' is not a valid app name. "
-            "App names must:\n"
-            "- Start with a lowercase letter\n"
-            "- Contain only lowercase letters, numbers, and underscores\n"
-            "- Be a valid Python identifier"
-        )
+        super().__init__(_APP_NAME_MSG.format(name=name))
 
 
 class TemplateRenderError(DjCraftError):
@@ -1,7 +1,10 @@
+import bisect
+from functools import cached_property
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
-from .configuration_manager import ConfigurationManager
+from .configuration_manager import get_default_config_manager
 from .exceptions import (
     InvalidAppNameError,
     InvalidDirectoryNameError,
@@ -11,6 +14,21 @@ from .exceptions import (
 )
 from .rules import StructureRules
 
+# path separators -> '.', for turning a relative path into a dotted import path in one pass
+_PATH_TO_DOTTED = str.maketrans({'/': '.', '\\': '.'})
+
+
+def _to_import_path(path: str) -> str:
+    """Convert a relative path ('apps/blog', or with backslashes) to a dotted import path"""
+    return path.translate(_PATH_TO_DOTTED)
+
+
+class AppsSoA(NamedTuple):
+    """Apps as parallel tuples (in insertion order) for loops that touch every app"""
+    names: Tuple[str, ...]
+    paths: Tuple[str, ...]
+    dotted_paths: Tuple[str, ...]
+
 
 class ProjectStructureManager:
     """
@@ -31,6 +49,10 @@ class ProjectStructureManager:
             'services': []      # some services to include
         }
         self.project_path = Path(project_name)
+
+        # sorted views used for display, kept in order as items are added
+        self._apps_sorted: List[Tuple[str, str]] = []
+        self._directories_sorted: List[Tuple[str, Dict[str, Any]]] = []
     
     def add_directory(self, dir_name: str, parent_path: Optional[str] = None) -> str:
         """
@@ -69,6 +91,11 @@ class ProjectStructureManager:
                 'apps': [],
                 'subdirs': []
             }
+            bisect.insort(
+                self._directories_sorted,
+                (full_path, self.structure['directories'][full_path]),
+                key=itemgetter(0)
+            )
             
             # update parent's subdirs if it exists
             if parent_path and parent_path in self.structure['directories']:
@@ -103,11 +130,30 @@ class ProjectStructureManager:
         
         app_path = f"{directory_path}/{app_name}" if directory_path else app_name
         self.structure['apps'][app_name] = app_path
+        bisect.insort(self._apps_sorted, (app_name, app_path))
+        self.__dict__.pop('app_import_paths_dotted', None)
+        self.__dict__.pop('apps_soa', None)
         
         # adding app to directory's app list
         if directory_path:
             self.structure['directories'][directory_path]['apps'].append(app_name)
     
+    def apps_sorted(self) -> List[Tuple[str, str]]:
+        """
+        Get (app name, app path) pairs sorted by app name
+
+        The list is kept sorted as apps are added; do not mutate it.
+        """
+        return self._apps_sorted
+
+    def directories_sorted(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Get (directory path, directory info) pairs sorted by path
+
+        The list is kept sorted as directories are added; do not mutate it.
+        """
+        return self._directories_sorted
+
     def set_core_location(self, location_type: str, path: str) -> None:
         """
         Set the location for core Django files
@@ -146,6 +192,8 @@ class ProjectStructureManager:
 
         self.structure['core']['location'] = location_type
         self.structure['core']['path'] = path
+        for cached in ('core_import_base', 'core_depth', 'parent_dir_calculation', 'core_path'):
+            self.__dict__.pop(cached, None)
     
     def add_service(self, service_name: str, options: Optional[Dict] = None) -> None:
         """
@@ -156,22 +204,29 @@ class ProjectStructureManager:
             options: Configuration options for the service
         """
         # Check if service name is valid using the dataclass method
-        if service_name not in ConfigurationManager().get_available_services():
+        if service_name not in get_default_config_manager().get_available_services():
             raise ValueError(f"Unknown service: {service_name}")
         
-        existing_services = [s['name'] for s in self.structure['services']]
-        if service_name in existing_services:
+        if service_name in self.service_names:
             raise StructureValidationError(f"Service '{service_name}' already added")
         
         self.structure['services'].append({
             'name': service_name,
             'options': options or {}
         })
+        self.__dict__.pop('service_names', None)
 
     def get_services(self) -> List[Dict]:
         """Get the list of added services."""
         return self.structure['services']
 
+    def get_service_options(self, service_name: str) -> Dict:
+        """Get the options of an added service (empty if the service wasn't added)."""
+        for service in self.structure['services']:
+            if service['name'] == service_name:
+                return service['options']
+        return {}
+
     def get_core_location(self) -> str:
         """Get the configured core location type ('root' or 'custom')."""
         return self.structure['core']['location']
@@ -182,10 +237,35 @@ class ProjectStructureManager:
 
     def has_service(self, service_name: str) -> bool:
         """Check if a specific service has been added to the structure."""
-        return service_name in [s['name'] for s in self.structure['services']]
+        return service_name in self.service_names
+
+    @cached_property
+    def service_names(self) -> FrozenSet[str]:
+        """Get the names of the added services (reset when a service is added)"""
+        return frozenset(s['name'] for s in self.structure['services'])
     
+    @cached_property
+    def core_import_base(self) -> str:
+        """Get the core path as a dotted Python import path (reset when the core location changes)"""
+        return _to_import_path(self.get_core_path_str())
+
+    @cached_property
+    def core_depth(self) -> int:
+        """Get the number of path parts in the core path (reset when the core location changes)"""
+        return len(Path(self.get_core_path_str()).parts)
+
+    @cached_property
+    def parent_dir_calculation(self) -> str:
+        """Get the '.parent' chain leading from a settings module up to the project root"""
+        return '.parent' * (self.core_depth + 1)
+
     def get_core_path(self) -> Path:
         """Get the full filesystem path for core files"""
+        return self.core_path
+
+    @cached_property
+    def core_path(self) -> Path:
+        """Get the full filesystem path for core files (reset when the core location changes)"""
         return self.project_path / self.get_core_path_str()
     
     def validate_structure(self) -> List[str]:
@@ -222,9 +302,30 @@ class ProjectStructureManager:
         Returns:
             Dictionary mapping app name to import path
         """
-        import_paths = {}
-        for app_name, app_path in self.structure['apps'].items():
-            import_path = app_path.replace('/', '.')
-            import_paths[app_name] = import_path
-        
-        return import_paths
+        return {
+            app_name: _to_import_path(app_path)
+            for app_name, app_path in self.structure['apps'].items()
+        }
+
+    @cached_property
+    def app_import_paths_dotted(self) -> Dict[str, str]:
+        """
+        Cached version of get_python_import_paths (reset when an app is added)
+
+        Returns:
+            Dictionary mapping app name to import path; do not mutate it.
+        """
+        return self.get_python_import_paths()
+
+    @cached_property
+    def apps_soa(self) -> AppsSoA:
+        """
+        Get all apps as parallel tuples of names, paths and dotted import paths
+        (reset when an app is added)
+        """
+        apps = self.structure['apps']
+        return AppsSoA(
+            names=tuple(apps),
+            paths=tuple(apps.values()),
+            dotted_paths=tuple(_to_import_path(path) for path in apps.values()),
+        )
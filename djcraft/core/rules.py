@@ -1,39 +1,45 @@
 import re
-from typing import Dict, List
+from typing import Dict, FrozenSet, Iterable
 
 
 class StructureRules:
     """
     Rules for validating Django project structure elements.
     """
-    PROJECT_NAME_REGEX = r'^[a-zA-Z][a-zA-Z0-9_]+$'
-    APP_NAME_REGEX = r'^[a-z][a-z0-9_]+$'
-    DIRECTORY_NAME_REGEX = r'^[a-zA-Z][a-zA-Z0-9_-]+$'
+    PROJECT_NAME_REGEX = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]+$')
+    APP_NAME_REGEX = re.compile(r'^[a-z][a-z0-9_]+$')
+    DIRECTORY_NAME_REGEX = re.compile(r'^[a-zA-Z][a-zA-Z0-9_-]+$')
     RESERVED_NAMES = {
         'django', 'test', 'settings', 'setup', 'admin', 'auth',
         'contenttypes', 'sessions', 'messages', 'static', 'staticfiles'
     }
+    # service -> services that must be added before it
+    SERVICE_DEPENDENCIES: Dict[str, FrozenSet[str]] = {
+        'celery': frozenset({'redis'}),
+    }
+    # service -> services it can't be combined with; none of the current services conflict
+    SERVICE_CONFLICTS: Dict[str, FrozenSet[str]] = {}
     
     @classmethod
     def is_valid_project_name(cls, name: str) -> bool:
         """Check if project name is valid"""
         if name.lower() in cls.RESERVED_NAMES:
             return False
-        return bool(re.match(cls.PROJECT_NAME_REGEX, name))
+        return bool(cls.PROJECT_NAME_REGEX.match(name))
     
     @classmethod
     def is_valid_app_name(cls, name: str) -> bool:
         """Check if app name is valid"""
         if name.lower() in cls.RESERVED_NAMES:
             return False
-        return bool(re.match(cls.APP_NAME_REGEX, name))
+        return bool(cls.APP_NAME_REGEX.match(name))
     
     @classmethod
     def is_valid_directory_name(cls, name: str) -> bool:
         """Check if directory name is valid"""
         if name.lower() in cls.RESERVED_NAMES:
             return False
-        return bool(re.match(cls.DIRECTORY_NAME_REGEX, name))
+        return bool(cls.DIRECTORY_NAME_REGEX.match(name))
     
     # @classmethod
     # def can_add_directory(cls, structure: Dict, path: str) -> bool:
@@ -84,36 +90,23 @@ class StructureRules:
         return True
     
     @classmethod
-    def validate_service_compatibility(cls, service_name: str, existing_services: List[str]) -> bool:
+    def validate_service_compatibility(cls, service_name: str, existing_services: Iterable[str]) -> bool:
         """
         Check if a new service is compatible with existing services
 
         Args:
             service_name: Name of service to add
-            existing_services: List of existing service names
+            existing_services: Existing service names (a set makes the checks O(1) per rule)
 
         Returns:
             True if service is compatible, False otherwise
         """
-        # define service dependencies and conflicts
-        dependencies = {
-            'celery': ['redis'],
-        }
-
-        conflicts = {
-            # Example conflicts:
-            # 'service_a': ['service_b'], # service_a conflicts with service_b
-            # 'authentication': ['rest_api'], # Example: If using a specific auth method incompatible with default DRF auth
-        } # TODO: Add actual service conflict rules here based on your service implementations
-
-        if service_name in dependencies:
-            for dep in dependencies[service_name]:
-                if dep not in existing_services:
-                    return False
+        dependencies = cls.SERVICE_DEPENDENCIES.get(service_name)
+        if dependencies and not dependencies.issubset(existing_services):
+            return False
 
-        if service_name in conflicts:
-            for conflict in conflicts[service_name]:
-                if conflict in existing_services:
-                    return False
+        conflicts = cls.SERVICE_CONFLICTS.get(service_name)
+        if conflicts and not conflicts.isdisjoint(existing_services):
+            return False
 
         return True
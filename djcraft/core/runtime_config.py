@@ -1,12 +1,15 @@
+import copy
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List
 
-import yaml
-
 from .config import (
+    DEFAULT_CLI_DICT,
+    DEFAULT_DJANGO_DICT,
+    DEFAULT_FILES_DICT,
+    DEFAULT_PROJECT_STRUCTURE_DICT,
+    DEFAULT_TEMPLATE_DICT,
     CliDefaultSettings,
-    DefaultSettings,
     DjangoDefaultsSettings,
     FilesDefaultSettings,
     ProjectStructureDefaultSettings,
@@ -26,50 +29,49 @@ class RuntimeConfig:
     directories: List[Dict[str, str]] = field(default_factory=list)
     apps: List[Dict[str, str]] = field(default_factory=list)
     services: List[Dict[str, Any]] = field(default_factory=list)
+    # whether the YAML file itself set a non-null project_name (cli.project_name always has a default)
+    project_name_provided: bool = False
     
     @classmethod
     def from_yaml(cls, yaml_path: Path) -> 'RuntimeConfig':
         """Load configuration from a YAML file and merge with default settings."""
+        # imported here so that loading the config package doesn't pull in yaml
+        import yaml
+
         try:
-            with open(yaml_path, 'r') as f:
-                yaml_config = yaml.safe_load(f)
+            yaml_config = yaml.load(Path(yaml_path).read_bytes(), Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
 
             if not isinstance(yaml_config, dict):
-                raise ConfigurationError("YAML configuration must be a dictionary")
+                raise ConfigurationError(str(yaml_path), "YAML configuration must be a dictionary")
 
             config = {
-                'project_structure': asdict(DefaultSettings.PROJECT_STRUCTURE),
-                'files': asdict(DefaultSettings.DEFAULT_FILES),
-                'template': asdict(DefaultSettings.TEMPLATE_CONFIG),
-                'django': asdict(DefaultSettings.DJANGO_DEFAULTS),
-                'cli': asdict(DefaultSettings.CLI_DEFAULTS),
+                'project_structure': copy.deepcopy(DEFAULT_PROJECT_STRUCTURE_DICT),
+                'files': copy.deepcopy(DEFAULT_FILES_DICT),
+                'template': copy.deepcopy(DEFAULT_TEMPLATE_DICT),
+                'django': copy.deepcopy(DEFAULT_DJANGO_DICT),
+                'cli': copy.deepcopy(DEFAULT_CLI_DICT),
                 'directories': [],
                 'apps': [],
                 'services': []
             }
 
-            if 'project_name' in yaml_config:
-                config['cli']['project_name'] = yaml_config['project_name']
+            if (project_name := yaml_config.get('project_name')) is not None:
+                config['cli']['project_name'] = project_name
 
-            if 'core' in yaml_config:
-                if 'location' in yaml_config['core']:
-                    config['project_structure']['core_location'] = yaml_config['core']['location']
-                if 'path' in yaml_config['core']:
-                    config['project_structure']['core_path'] = yaml_config['core']['path']
+            if core_config := yaml_config.get('core'):
+                if (core_location := core_config.get('location')) is not None:
+                    config['project_structure']['core_location'] = core_location
+                if (core_path := core_config.get('path')) is not None:
+                    config['project_structure']['core_path'] = core_path
 
-            if 'directories' in yaml_config:
-                config['directories'] = yaml_config['directories']
-            
-            if 'apps' in yaml_config:
-                config['apps'] = yaml_config['apps']
-                
-            if 'services' in yaml_config:
-                config['services'] = yaml_config['services']
+            for section in ('directories', 'apps', 'services'):
+                if (section_config := yaml_config.get(section)) is not None:
+                    config[section] = section_config
 
             # merge additional sections from YAML
-            for section in ['project_structure', 'files', 'template', 'django', 'cli']:
-                if section in yaml_config:
-                    config[section].update(yaml_config[section])
+            for section in ('project_structure', 'files', 'template', 'django', 'cli'):
+                if section_config := yaml_config.get(section):
+                    config[section].update(section_config)
 
             # create RuntimeConfig instance
             return cls(
@@ -80,13 +82,16 @@ class RuntimeConfig:
                 cli=CliDefaultSettings(**config['cli']),
                 directories=config['directories'],
                 apps=config['apps'],
-                services=config['services']
+                services=config['services'],
+                project_name_provided=project_name is not None
             )
 
+        except FileNotFoundError as e:
+            raise ConfigurationError(str(yaml_path), "Config file not found") from e
         except yaml.YAMLError as e:
-            raise ConfigurationError(f"Error parsing YAML configuration: {e}")
+            raise ConfigurationError(str(yaml_path), f"Error parsing YAML configuration: {e}")
         except Exception as e:
-            raise ConfigurationError(f"Error loading configuration: {e}")
+            raise ConfigurationError(str(yaml_path), f"Error loading configuration: {e}")
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the RuntimeConfig to a dictionary."""
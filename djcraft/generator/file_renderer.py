@@ -1,7 +1,7 @@
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-from .rendering import Jinja2RendererStrategy, RendererStrategy
+from .rendering import Jinja2RendererStrategy, RendererStrategy, write_file_bytes
 
 
 class FileRenderer:
@@ -15,9 +15,11 @@ class FileRenderer:
         """
         self.template_dir = template_dir
         self.renderer = renderer_strategy or Jinja2RendererStrategy(template_dir)
+        # encoded output of context-free templates, rendered on first use
+        self._static_cache: Dict[str, bytes] = {}
 
 
-    def render_template(self, template_name: str, output_path: Path, context: Optional[Dict[str, Any]] = None) -> None:
+    def render_template(self, template_name: str, output_path: Path, context: Optional[Dict[str, Any]] = None, mode: Optional[int] = None, skip_mkdir: bool = False) -> None:
         """
         Render a template with the given context and write the output to a file.
 
@@ -26,9 +28,38 @@ class FileRenderer:
                            Can include subdirectories (e.g., 'project_template/core/settings/base.py.template').
             output_path: The full filesystem path where the rendered content should be written.
             context: A dictionary containing data to be passed to the template.
+            mode: Optional permission bits for the output file (e.g. 0o755 for scripts).
+            skip_mkdir: Set when the caller already created the output directory.
         """
-        self.renderer.render_template(template_name, output_path, context)
-        
+        self.renderer.render_template(template_name, output_path, context, mode, skip_mkdir)
+
+    def render_many(self, jobs: Iterable[Tuple[str, Path, Optional[Dict[str, Any]]]], skip_mkdir: bool = False) -> None:
+        """
+        Render several templates to files, one after another.
+
+        Args:
+            jobs: (template name, output path, context) per file; contexts may be shared between jobs.
+            skip_mkdir: Set when the caller already created every output directory.
+        """
+        for template_name, output_path, context in jobs:
+            self.render_template(template_name, output_path, context, skip_mkdir=skip_mkdir)
+
+    def render_static(self, template_name: str, output_path: Path) -> None:
+        """
+        Write a template that takes no context, rendering it only the first time it is used.
+
+        Args:
+            template_name: The name of the template file within the template directory.
+            output_path: The full filesystem path where the content should be written.
+        """
+        content = self._static_cache.get(template_name)
+        if content is None:
+            content = self.render_template_to_string(template_name).encode('utf-8')
+            self._static_cache[template_name] = content
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_file_bytes(output_path, content)
+
     def render_template_to_string(self, template_name: str, context: Optional[Dict[str, Any]] = None) -> str:
         """
         Render a template with the given context and return the result as a string.
@@ -41,4 +72,3 @@ class FileRenderer:
             The rendered template as a string.
         """
         return self.renderer.render_template_to_string(template_name, context)
-
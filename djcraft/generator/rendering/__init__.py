@@ -1,3 +1,3 @@
-from .renderer_strategy import RendererStrategy, Jinja2RendererStrategy
+from .renderer_strategy import RendererStrategy, Jinja2RendererStrategy, write_file_bytes
 
-__all__ = ['RendererStrategy', 'Jinja2RendererStrategy']
+__all__ = ['RendererStrategy', 'Jinja2RendererStrategy', 'write_file_bytes']
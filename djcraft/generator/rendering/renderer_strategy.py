@@ -1,13 +1,110 @@
+import os
+import stat
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateNotFound
+
+from core.exceptions import TemplateRenderError
+
+def _open_output_fd(output_path: Path, mode: Optional[int] = None) -> int:
+    """
+    Open (create or truncate) a file for writing and return the raw fd.
+    If mode is given it is set on the open fd, so it applies to existing files too.
+    """
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666 if mode is None else mode)
+    if mode is not None:
+        try:
+            os.fchmod(fd, mode)
+        except OSError:
+            os.close(fd)
+            raise
+    return fd
+
+
+def _has_content(output_path: Path, data: bytes, mode: Optional[int] = None) -> bool:
+    """Check whether the file already holds exactly this content (and mode, if given)."""
+    try:
+        st = os.stat(output_path)
+    except OSError:
+        return False
+    # the size check makes the common "new or changed" case cost a single stat
+    if st.st_size != len(data) or (mode is not None and stat.S_IMODE(st.st_mode) != mode):
+        return False
+    try:
+        with open(output_path, 'rb') as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def write_file_bytes(output_path: Path, data: bytes, mode: Optional[int] = None) -> None:
+    """
+    Write encoded content to a file through a raw fd, skipping the text I/O layer.
+    A file that already has this content is left untouched, so regenerating keeps its mtime.
+    """
+    if _has_content(output_path, data, mode):
+        return
+    fd = _open_output_fd(output_path, mode)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _bytecode_cache_dir() -> Optional[Path]:
+    """
+    Get the directory for compiled template bytecode shared between runs.
+    The cache is opt-in with DJCRAFT_BYTECODE_CACHE=1; None if it is off
+    or the directory can't be created.
+    """
+    if os.environ.get('DJCRAFT_BYTECODE_CACHE') != '1':
+        return None
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    cache_dir = Path(cache_home) / 'djcraft' / 'jinja'
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return cache_dir
+
+
+# one Environment per template dir, so strategies over the same dir share compiled templates
+_ENV_CACHE: Dict[str, Environment] = {}
+_ENV_CACHE_LOCK = threading.Lock()
+
+
+def _get_or_create_env(template_dir: str) -> Environment:
+    """Get the shared Jinja2 Environment for a template directory, creating it on first use."""
+    with _ENV_CACHE_LOCK:
+        env = _ENV_CACHE.get(template_dir)
+        if env is None:
+            # when enabled, compiled templates are kept on disk so later runs skip parsing (entries are keyed by source checksum)
+            cache_dir = _bytecode_cache_dir()
+            bytecode_cache = FileSystemBytecodeCache(str(cache_dir)) if cache_dir else None
+            # templates are not edited during a run, so skip Jinja's per-load mtime check
+            env = Environment(
+                loader=FileSystemLoader(template_dir),
+                autoescape=True,
+                auto_reload=False,
+                bytecode_cache=bytecode_cache,
+            )
+            _ENV_CACHE[template_dir] = env
+        return env
 
 
 class RendererStrategy(ABC):
 
     @abstractmethod
-    def render_template(self, template_name: str, output_path: Path, context: Optional[Dict[str, Any]] = None) -> None:
-        """Render a template with the given context and write the output to a file."""
+    def render_template(self, template_name: str, output_path: Path, context: Optional[Dict[str, Any]] = None, mode: Optional[int] = None, skip_mkdir: bool = False) -> None:
+        """
+        Render a template with the given context and write the output to a file (with mode, if given).
+        With skip_mkdir the caller guarantees the parent directory already exists.
+        """
         pass
 
     @abstractmethod
@@ -20,42 +117,60 @@ class Jinja2RendererStrategy(RendererStrategy):
 
     def __init__(self, template_dir: str):
         """Initialize the Jinja2RendererStrategy with the template directory."""
-        from jinja2 import Environment, FileSystemLoader, TemplateNotFound
         self.template_dir = template_dir
-        self.template_env = Environment(loader=FileSystemLoader(template_dir), autoescape=True)
-        self.TemplateNotFound = TemplateNotFound
+        self.template_env = _get_or_create_env(template_dir)
+        self._template_cache: Dict[str, Any] = {}
+        # output dirs already created by this strategy, so repeat renders skip mkdir
+        self._known_dirs: Set[Path] = set()
+
+    @property
+    def env(self):
+        """The Jinja2 Environment used to load templates."""
+        return self.template_env
 
-    def render_template(self, template_name: str, output_path: Path, context: Optional[Dict[str, Any]] = None) -> None:
-        """Render a template with the given context and write the output to a file."""
-        from core.exceptions import TemplateRenderError
+    def _get_template(self, template_name: str):
+        """Return the compiled template, loading and compiling it only on first use."""
+        template = self._template_cache.get(template_name)
+        if template is None:
+            template = self.template_env.get_template(template_name)
+            self._template_cache[template_name] = template
+        return template
+
+    def render_template(self, template_name: str, output_path: Path, context: Optional[Dict[str, Any]] = None, mode: Optional[int] = None, skip_mkdir: bool = False) -> None:
+        """
+        Render a template with the given context and write the output to a file.
+        An output file that already has the rendered content is left untouched.
+        """
         context = context or {}
         original_template_name = template_name
 
         try:
-            template = self.template_env.get_template(template_name)
-            rendered_content = template.render(**context)
+            template = self._get_template(template_name)
+            # render fully before touching the file, so a failing template leaves it intact
+            data = template.render(**context).encode('utf-8')
 
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if not skip_mkdir:
+                parent = output_path.parent
+                if parent not in self._known_dirs:
+                    parent.mkdir(parents=True, exist_ok=True)
+                    self._known_dirs.add(parent)
 
-            # Write the rendered content to the output file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(rendered_content)
+            write_file_bytes(output_path, data, mode)
 
-        except self.TemplateNotFound as e:
+        except TemplateNotFound as e:
             raise TemplateRenderError(f"Template file not found: '{original_template_name}'", e) from e
         except Exception as e:
             raise TemplateRenderError(f"Error rendering template '{original_template_name}' to '{output_path}': {e}", e) from e
 
     def render_template_to_string(self, template_name: str, context: Optional[Dict[str, Any]] = None) -> str:
         """Render a template with the given context and return the result as a string."""
-        from core.exceptions import TemplateRenderError
         context = context or {}
         original_template_name = template_name
 
         try:
-            template = self.template_env.get_template(template_name)
+            template = self._get_template(template_name)
             return template.render(**context)
-        except self.TemplateNotFound as e:
+        except TemplateNotFound as e:
             raise TemplateRenderError(f"Template file not found: '{original_template_name}'", e) from e
         except Exception as e:
             raise TemplateRenderError(f"Error rendering template '{original_template_name}' to string: {e}", e) from e
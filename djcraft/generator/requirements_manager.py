@@ -1,5 +1,10 @@
+import logging
 from pathlib import Path
-from typing import List
+from typing import Iterable
+
+from .rendering import write_file_bytes
+
+logger = logging.getLogger(__name__)
 
 class RequirementsManager:
     """
@@ -23,26 +28,30 @@ class RequirementsManager:
         """
         Loads packages from an existing requirements.txt file into the internal set.
         """
-        if self.requirements_file_path.exists():
-            try:
-                with open(self.requirements_file_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'): # ignore empty lines and comments
-                            self._packages.add(line)
-            except Exception as e:
-                print(f"Warning: Could not load existing requirements.txt: {e}")
+        try:
+            # one read of the whole (small) file, decoded once; a missing file
+            # shows up as FileNotFoundError instead of costing a separate exists() stat
+            content = self.requirements_file_path.read_bytes().decode('utf-8')
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning("Could not load existing requirements.txt: %s", e)
+            return
+
+        for line in content.splitlines():
+            line = line.strip()
+            if line and not line.startswith('#'): # ignore empty lines and comments
+                self._packages.add(line)
 
 
-    def add_packages(self, packages: List[str]) -> None:
+    def add_packages(self, packages: Iterable[str]) -> None:
         """
-        Adds a list of packages to the internal set of requirements.
+        Adds packages to the internal set of requirements in one update.
 
         Args:
-            packages: A list of package strings (e.g., ['django>=4.0', 'celery']).
+            packages: Any iterable of package strings (e.g., {'django>=4.0', 'celery'}).
         """
-        for package in packages:
-            self._packages.add(package.strip())
+        self._packages.update(package.strip() for package in packages)
 
     def write_requirements_file(self) -> None:
         """
@@ -52,9 +61,8 @@ class RequirementsManager:
         try:
             self.project_path.mkdir(parents=True, exist_ok=True)
 
-            with open(self.requirements_file_path, 'w', encoding='utf-8') as f:
-                f.write("# Project requirements generated by Django Boilerplate Generator\n\n")
-                for package in sorted(list(self._packages)):
-                    f.write(f"{package}\n")
+            content = "# Project requirements generated by Django Boilerplate Generator\n\n"
+            content += "".join(f"{package}\n" for package in sorted(self._packages))
+            write_file_bytes(self.requirements_file_path, content.encode('utf-8'))
         except Exception as e:
             raise IOError(f"Error writing requirements.txt to {self.requirements_file_path}: {e}") from e
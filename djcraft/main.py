@@ -1,75 +1,120 @@
 #!/usr/bin/env python3
+import importlib.util
+import logging
+import os
 import sys
+from functools import lru_cache
 
-from cli.argument_parser import create_argument_parser
-from cli.commands import (
-    handle_create_command,
-    handle_generate_from_config,
-    handle_validate_command,
-)
-from cli.interactive import run_interactive_mode
+from cli.argument_parser import create_argument_parser, create_help_parser
 from core.exceptions import DjCraftError 
 
-try:
+# checked without importing rich; it's only loaded once styled output is needed
+RICH_AVAILABLE = importlib.util.find_spec('rich') is not None
+# piped/redirected output would have its styling stripped anyway, so it gets plain print();
+# DJCRAFT_NO_RICH=1 forces that for scripted runs (interactive mode still uses rich)
+STYLED_OUTPUT = RICH_AVAILABLE and sys.stdout.isatty() and os.environ.get('DJCRAFT_NO_RICH') != '1'
+
+
+@lru_cache(maxsize=1)
+def _get_console():
+    """Get the Rich console (None without rich), importing rich on first use"""
+    if not RICH_AVAILABLE:
+        return None
     from rich.console import Console
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-
-
-class DjCraftCli:
-    """
-    Command Line Interface for Django Boilerplate Generator
-    """
-    def __init__(self):
-        self.console = Console() if RICH_AVAILABLE else None
-        self.structure_manager = None
-
-    def run(self):
-        """Main entry point for CLI"""
-        parser = create_argument_parser()
-        args = parser.parse_args()
-
-        try:
-            if args.command == 'create':
-                handle_create_command(args)
-            elif args.command == 'interactive':
-                if not RICH_AVAILABLE:
-                    print("Rich library is required for interactive mode.")
-                    print("Install it with: pip install rich")
-                    sys.exit(1)
-                run_interactive_mode(self.console)
-            elif args.command == 'generate':
-                handle_generate_from_config(args.config_file)
-            elif args.command == 'validate':
-                handle_validate_command(args.config_file, self.console, RICH_AVAILABLE)
-            else:
-                parser.print_help()
-        except DjCraftError as e:
-            self._print_error(f"Error: {e}")
-            sys.exit(1)
-        except Exception as e:
-            self._print_error(f"Unexpected error: {e}")
-            if args.command == 'interactive':
-                import traceback
-                traceback.print_exc()
-            sys.exit(1)
-
-    def _print_error(self, message):
-        """Print error message with formatting if available"""
-        if self.console:
-            self.console.print(f"[bold red]{message}[/bold red]")
-        else:
-            print(f"Error: {message}")
-
-    def _print_success(self, message):
-        """Print success message with formatting if available"""
-        if self.console:
-            self.console.print(f"[bold green]{message}[/bold green]")
-        else:
-            print(f"Success: {message}")
+    return Console()
+
+
+def _get_styled_console():
+    """Get the Rich console for status messages, or None when output isn't styled"""
+    return _get_console() if STYLED_OUTPUT else None
+
+
+def _print_error(message):
+    """Print error message with formatting if available"""
+    console = _get_styled_console()
+    if console:
+        console.print(f"[bold red]{message}[/bold red]")
+    else:
+        print(message, file=sys.stderr)
+
+
+def _print_success(message):
+    """Print success message with formatting if available"""
+    console = _get_styled_console()
+    if console:
+        console.print(f"[bold green]{message}[/bold green]")
+    else:
+        print(f"Success: {message}")
+
+
+def _run_create(args):
+    from cli.commands import handle_create_command
+    handle_create_command(args)
+
+
+def _run_interactive(args):
+    if not RICH_AVAILABLE:
+        print("Rich library is required for interactive mode.")
+        print("Install it with: pip install rich")
+        raise SystemExit(1)
+    from cli.interactive import run_interactive_mode
+    run_interactive_mode(_get_console())
+
+
+def _run_generate(args):
+    from cli.commands import handle_generate_from_config
+    handle_generate_from_config(args.config_file)
+
+
+def _run_validate(args):
+    from cli.commands import handle_validate_command
+    # without a terminal there's no one to answer the preview prompt either
+    handle_validate_command(args.config_file, _get_styled_console(), STYLED_OUTPUT)
+
+
+# command -> runner; each runner imports only its own handler (and what that handler needs)
+COMMAND_RUNNERS = {
+    'create': _run_create,
+    'interactive': _run_interactive,
+    'generate': _run_generate,
+    'validate': _run_validate,
+}
+
+
+def main():
+    """Main entry point for CLI"""
+    # top-level help only lists the commands, so skip building their parsers
+    if len(sys.argv) == 1 or sys.argv[1] in ('-h', '--help'):
+        create_help_parser().print_help()
+        return
+
+    # the first argument picks the subcommand, so only its parser gets built
+    command = sys.argv[1]
+    parser = create_argument_parser(command)
+    args = parser.parse_args()
+
+    runner = COMMAND_RUNNERS.get(args.command)
+    if runner is None:
+        parser.print_help()
+        return
+
+    try:
+        runner(args)
+    except DjCraftError as e:
+        if not STYLED_OUTPUT:
+            # SystemExit prints a message argument to stderr itself and exits with status 1
+            raise SystemExit(f"Error: {e}")
+        _print_error(f"Error: {e}")
+        raise SystemExit(1)
+    except Exception as e:
+        _print_error(f"Unexpected error: {e}")
+        if args.command == 'interactive':
+            # the interpreter's own hook prints the same traceback report
+            sys.excepthook(*sys.exc_info())
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
-    cli = DjCraftCli()
-    cli.run()
+    # library modules log their warnings; show them the way the CLI used to print them
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    main()
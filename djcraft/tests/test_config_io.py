@@ -0,0 +1,41 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from cli.config_io import validate_config
+from core.configuration_manager import ConfigurationManager
+
+
+class TestValidateConfig(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _write_config(self, content):
+        config_path = Path(self.tmp_dir.name) / 'config.yaml'
+        config_path.write_text(content)
+        return ConfigurationManager(config_path)
+
+    def test_missing_project_name(self):
+        config = self._write_config("apps:\n  - name: blog\n    type: standard\n")
+
+        self.assertEqual(validate_config(config), ["Missing required field: project_name"])
+
+    def test_null_project_name(self):
+        config = self._write_config("project_name: null\n")
+
+        self.assertEqual(validate_config(config), ["Missing required field: project_name"])
+
+    def test_empty_project_name(self):
+        config = self._write_config("project_name: ''\n")
+
+        self.assertEqual(validate_config(config), ["Project name cannot be empty"])
+
+    def test_valid_config(self):
+        config = self._write_config("project_name: demo\n")
+
+        self.assertEqual(validate_config(config), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
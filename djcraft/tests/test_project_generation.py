@@ -0,0 +1,81 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.project_structure_manager import ProjectStructureManager
+from generator.generator import DjangoProjectGenerator
+
+
+class TestProjectGeneration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cwd = os.getcwd()
+        # project_path is relative to the cwd
+        os.chdir(cls.tmp_dir.name)
+        try:
+            structure_manager = ProjectStructureManager('demo')
+            structure_manager.add_directory('apps')
+            structure_manager.add_app('blog', 'apps')
+            structure_manager.add_app('api_posts', 'apps')
+            structure_manager.add_app('users')
+            for service in ('docker', 'redis', 'celery', 'rest_api'):
+                structure_manager.add_service(service)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                DjangoProjectGenerator(structure_manager).generate()
+        finally:
+            os.chdir(cwd)
+
+        cls.project_dir = Path(cls.tmp_dir.name) / 'demo'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def _read(self, relative_path):
+        return (self.project_dir / relative_path).read_text()
+
+    def test_settings(self):
+        settings = self._read('core/settings/base.py')
+
+        for app in ('rest_framework', 'apps.blog', 'apps.api_posts', 'users'):
+            self.assertIn(f"'{app}'", settings)
+        self.assertIn(
+            "CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://redis:6379/0')", settings
+        )
+        self.assertIn(
+            "CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', 'redis://redis:6379/0')", settings
+        )
+
+    def test_urls(self):
+        urls = self._read('core/urls.py')
+
+        self.assertIn("path('blog/', include('apps.blog.urls'))", urls)
+        self.assertIn("path('api_posts/', include('apps.api_posts.urls'))", urls)
+        self.assertIn("path('users/', include('users.urls'))", urls)
+
+    def test_requirements(self):
+        requirements = self._read('requirements.txt').splitlines()
+
+        for package in ('celery', 'redis', 'django-redis', 'djangorestframework', 'gunicorn'):
+            self.assertIn(package, requirements)
+
+    def test_app_and_service_files(self):
+        for relative_path in (
+            'apps/blog/models.py',
+            'apps/blog/tests/test_models.py',
+            'apps/api_posts/views.py',
+            'users/apps.py',
+            'core/celery.py',
+            'Dockerfile',
+            'docker-compose.yml',
+        ):
+            self.assertTrue((self.project_dir / relative_path).is_file(), relative_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.exceptions import TemplateRenderError
+from generator.rendering import Jinja2RendererStrategy
+
+
+class TestJinja2RendererStrategy(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_path = Path(tmp_dir.name)
+
+        template_dir = self.tmp_path / 'templates'
+        template_dir.mkdir()
+        (template_dir / 'good.txt.template').write_text("name = {{ name }}\n")
+        (template_dir / 'broken.txt.template').write_text("first line\n{{ missing.attribute }}\n")
+
+        self.renderer = Jinja2RendererStrategy(str(template_dir))
+        self.output_path = self.tmp_path / 'out' / 'file.txt'
+
+    def test_render_template(self):
+        self.renderer.render_template('good.txt.template', self.output_path, {'name': 'demo'})
+
+        self.assertEqual(self.output_path.read_text(), "name = demo")
+
+    def test_unchanged_output_is_not_rewritten(self):
+        self.renderer.render_template('good.txt.template', self.output_path, {'name': 'demo'})
+        os.utime(self.output_path, ns=(0, 0))
+
+        self.renderer.render_template('good.txt.template', self.output_path, {'name': 'demo'})
+        self.assertEqual(self.output_path.stat().st_mtime_ns, 0)
+
+        self.renderer.render_template('good.txt.template', self.output_path, {'name': 'other'})
+        self.assertNotEqual(self.output_path.stat().st_mtime_ns, 0)
+        self.assertEqual(self.output_path.read_text(), "name = other")
+
+    def test_failed_render_keeps_existing_file(self):
+        self.output_path.parent.mkdir()
+        self.output_path.write_text("existing content\n")
+
+        with self.assertRaises(TemplateRenderError):
+            self.renderer.render_template('broken.txt.template', self.output_path)
+
+        self.assertEqual(self.output_path.read_text(), "existing content\n")
+
+
+if __name__ == '__main__':
+    unittest.main()